@@ -1,7 +1,56 @@
+import atexit
+import contextlib
 import io
+import os
+import tempfile
 import pandas as pd
 import streamlit as st
-from utils.cleaner import clean_dataframe
+from utils.cleaner import clean_dataframe, clean_dataframe_dask
+from utils.fileio import read_table, write_xlsx
+
+# Lets pandas share column buffers until a column is written (always on from pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+	pd.options.mode.copy_on_write = True
+
+# CSV uploads above this size are cleaned out of core with Dask
+LARGE_CSV_BYTES = 200 * 1024 * 1024
+
+
+# Streamlit reruns the whole script on every widget change; caching on the raw
+# upload bytes (and the cleaning options) makes those reruns skip the work.
+# Each entry is a pickled frame, so only the last few are kept.
+@st.cache_data(show_spinner=False, max_entries=2)
+def read_upload(file_bytes: bytes, filename: str) -> pd.DataFrame:
+	return read_table(file_bytes, filename)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def clean_upload(file_bytes: bytes, filename: str, config_items: tuple):
+	"""Cleans an upload; config_items is the config as a sorted, hashable tuple."""
+	return clean_dataframe(read_upload(file_bytes, filename), dict(config_items))
+
+
+@st.cache_resource
+def dask_client():
+	from dask.distributed import Client, LocalCluster
+	# registers itself as the default scheduler for Dask computations
+	return Client(LocalCluster(n_workers=4))
+
+
+def remove_spill(path: str) -> None:
+	with contextlib.suppress(FileNotFoundError):
+		os.remove(path)
+
+
+# One spilled file per session: it is removed when a new upload replaces it,
+# when the session ends, or at the latest when the server exits.
+@st.cache_resource(max_entries=1, scope="session", on_release=remove_spill)
+def spill_upload(file_bytes: bytes, filename: str) -> str:
+	"""Writes a large upload to a temporary file once so Dask can read it in blocks."""
+	with tempfile.NamedTemporaryFile(suffix=f"_{filename}", delete=False) as tmp:
+		tmp.write(file_bytes)
+	atexit.register(remove_spill, tmp.name)
+	return tmp.name
 
 
 st.set_page_config(page_title="Excel Cleaner", layout="wide")
@@ -33,7 +82,7 @@ with st.sidebar:
 	if null_handling == 'fill':
 		fill_strategy = st.selectbox("Fill strategy", options=["mode", "mean", "median", "constant"], index=0)
 		if fill_strategy == 'constant':
-			fill_constant = st.text_input("Fill constant (applied as string); leave blank for empty string", value="")
+			fill_constant = st.text_input("Fill constant for text columns (numeric and date columns are left as is); leave blank for empty string", value="")
 	sample_rows = st.number_input("Preview rows", min_value=1, max_value=1000, value=100)
 
 	# Outlier detection options
@@ -53,12 +102,17 @@ with st.sidebar:
 if uploaded is not None:
 	file_bytes = uploaded.read()
 	filename = uploaded.name
+	large_csv = len(file_bytes) > LARGE_CSV_BYTES and not filename.lower().endswith(('.xls', '.xlsx'))
+	ddf = None
 	try:
-		if filename.lower().endswith(('.xls', '.xlsx')):
-			df = pd.read_excel(io.BytesIO(file_bytes), engine="openpyxl")
+		if large_csv:
+			import dask.dataframe as dd
+			dask_client()
+			ddf = dd.read_csv(spill_upload(file_bytes, filename), blocksize="64MB", assume_missing=True)
+			# only the preview rows are materialized
+			df = ddf.head(sample_rows)
 		else:
-			# try common encodings via pandas auto-detect
-			df = pd.read_csv(io.BytesIO(file_bytes))
+			df = read_upload(file_bytes, filename)
 	except Exception as e:
 		st.error(f"Error reading file: {e}")
 		st.stop()
@@ -88,11 +142,22 @@ if uploaded is not None:
 		"outlier_method": outlier_method,
 		"outlier_threshold": outlier_threshold,
 		"outlier_action": outlier_action,
+		# run the structural steps as one lazy Polars query
+		"engine": "polars",
 	}
 
 	if st.button("Run cleaning"):
 		with st.spinner("Cleaning..."):
-			cleaned, report = clean_dataframe(df.copy(), config)
+			if ddf is not None:
+				# Dask infers column types from the first block only, so a later
+				# block that does not fit them fails here rather than at read time
+				try:
+					cleaned, report = clean_dataframe_dask(ddf, config)
+				except Exception as e:
+					st.error(f"Error cleaning file: {e}")
+					st.stop()
+			else:
+				cleaned, report = clean_upload(file_bytes, filename, tuple(sorted(config.items())))
 
 		st.success("Cleaning finished")
 
@@ -120,15 +185,14 @@ if uploaded is not None:
 			except Exception:
 				pass
 
-		# CSV download
-		csv_bytes = cleaned.to_csv(index=False).encode('utf-8')
-		st.download_button("Download CSV", data=csv_bytes, file_name=f"cleaned_{filename.rsplit('.',1)[0]}.csv", mime='text/csv')
+		# CSV download (written straight into the buffer, no intermediate str)
+		csv_buf = io.BytesIO()
+		cleaned.to_csv(csv_buf, index=False)
+		csv_buf.seek(0)
+		st.download_button("Download CSV", data=csv_buf, file_name=f"cleaned_{filename.rsplit('.',1)[0]}.csv", mime='text/csv')
 
 		# Excel download
-		towrite = io.BytesIO()
-		with pd.ExcelWriter(towrite, engine="openpyxl") as writer:
-			cleaned.to_excel(writer, index=False, sheet_name='cleaned')
-		towrite.seek(0)
+		towrite = write_xlsx(cleaned, sheet_name='cleaned')
 		st.download_button("Download XLSX", data=towrite, file_name=f"cleaned_{filename.rsplit('.',1)[0]}.xlsx", mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
 
 	st.markdown("---")
@@ -1,4 +1,6 @@
+import io
 import sys
+from decimal import Decimal
 import pathlib
 import pandas as pd
 import pytest
@@ -31,6 +33,19 @@ def test_normalize_trim_infer_numeric():
     assert pd.api.types.is_numeric_dtype(cleaned['age'])
 
 
+def test_trim_leaves_non_text_arrow_columns_alone():
+    import pyarrow as pa
+    df = pd.DataFrame({
+        'price': pd.array([1.5, None], dtype=pd.ArrowDtype(pa.decimal128(5, 2))),
+        'name': [' a ', None],
+    })
+
+    cleaned, _ = clean_dataframe(df.copy(), {'trim_whitespace': True})
+
+    assert cleaned['price'].dtype == df['price'].dtype
+    assert cleaned['name'].tolist()[0] == 'a'
+
+
 def test_drop_blank_rows_cols_duplicates_and_report():
     df = pd.DataFrame({'A': [None, 1, 1], 'B': [None, 2, 2], 'C': [None, None, None]})
     cfg = {
@@ -55,6 +70,51 @@ def test_drop_blank_rows_cols_duplicates_and_report():
     assert cleaned.shape == (1, 2)
 
 
+def test_drop_duplicates_on_mixed_object_column():
+    # hash_pandas_object hashes 1 and '1' alike; only equal values may be dropped
+    df = pd.DataFrame({'v': pd.array([1, '1', 1.0, True, 'True'], dtype=object)})
+
+    cleaned, report = clean_dataframe(df.copy(), {'drop_duplicates': True})
+
+    expected = df.drop_duplicates()
+    assert report['duplicates_dropped'] == len(df) - len(expected) == 2
+    assert list(cleaned.index) == list(expected.index)
+
+
+def test_drop_duplicates_keeps_first_occurrence_and_treats_nulls_as_equal():
+    df = pd.DataFrame({
+        'a': ['x', None, 'x', None, 'y'],
+        'b': [1.0, float('nan'), 1.0, float('nan'), 1.0],
+    }, index=[5, 6, 7, 8, 9])
+
+    cleaned, report = clean_dataframe(df.copy(), {'drop_duplicates': True})
+
+    assert report['duplicates_dropped'] == 2
+    assert list(cleaned.index) == [5, 6, 9]
+
+
+def test_numpy_bool_flags_enable_steps():
+    import numpy as np
+    df = pd.DataFrame({'a': [1, 1, None], 'b': [' x ', ' x ', None]})
+    cfg = {'drop_duplicates': np.True_, 'drop_blank_rows': np.True_, 'trim_whitespace': np.bool_(True)}
+
+    cleaned, report = clean_dataframe(df.copy(), cfg)
+
+    assert report['duplicates_dropped'] == 1
+    assert report['blank_rows_dropped'] == 1
+    assert cleaned['b'].tolist() == ['x']
+
+
+def test_drop_duplicates_treats_signed_zeros_as_equal():
+    # round() produces -0.0, which equals 0.0 but has a different bit pattern
+    df = pd.DataFrame({'a': [0.0, -0.0, 1.0]})
+
+    cleaned, report = clean_dataframe(df.copy(), {'drop_duplicates': True})
+
+    assert report['duplicates_dropped'] == 1
+    assert list(cleaned.index) == [0, 2]
+
+
 def test_date_detection_and_dtype_change():
     df = pd.DataFrame({'d': ['2020-01-01', '2020/02/02', 'not a date', '']})
     cfg = {
@@ -78,6 +138,22 @@ def test_date_detection_and_dtype_change():
     assert parsed.notna().sum() >= 1
 
 
+def test_count_date_like():
+    import pyarrow as pa
+    from utils.cleaner import _count_date_like
+
+    values = ['2020-01-01', '01/02/2020', '1.2.2020', 'Jan 5', '5 march', 'ab 12',
+              '20200101', '', None, 'x-y']
+    # separators or a run of three letters count; nulls and plain digits do not
+    assert _count_date_like(pd.Series(values, dtype=object)) == 6
+    assert _count_date_like(pd.Series(values, dtype='string[pyarrow]')) == 6
+    assert _count_date_like(pd.Series(values, dtype=pd.ArrowDtype(pa.string()))) == 6
+    # non-string cells are judged by their string form
+    assert _count_date_like(pd.Series([1.5, 20200101, None], dtype=object)) == 1
+    assert _count_date_like(pd.Series([], dtype=object)) == 0
+    assert _count_date_like(pd.Series([None, None], dtype=object)) == 0
+
+
 def test_outlier_detection_skips_identifier_columns_when_dropping():
     # user_id contains an extreme value that would be an outlier if considered
     df = pd.DataFrame({
@@ -150,3 +226,269 @@ def test_null_handling_fill_mean_and_mode():
     # Categorical NaN should be filled with mode 'a'
     assert cleaned_cat['cat'].isna().sum() == 0
     assert cleaned_cat['cat'].iloc[1] == 'a'
+
+
+def test_null_handling_fill_skips_fractional_mean_for_integer_column():
+    df = pd.DataFrame({
+        'count': pd.array([1, None, 2], dtype='Int64'),
+        # Arrow integer columns would silently truncate 1.5 to 1
+        'arrow_count': pd.array([1, None, 2], dtype='int64[pyarrow]'),
+        'num': [1.0, None, 2.0],
+    })
+    cfg = {'null_handling': 'fill', 'fill_strategy': 'mean'}
+
+    cleaned, report = clean_dataframe(df.copy(), cfg)
+
+    # 1.5 cannot be stored in an integer column: those are left alone, the others still fill
+    assert str(cleaned['count'].dtype) == 'Int64'
+    assert cleaned['count'].isna().sum() == 1
+    assert cleaned['arrow_count'].isna().sum() == 1
+    assert cleaned['num'].tolist() == [1.0, 1.5, 2.0]
+    assert report['nulls_filled'] == {'num': 1}
+
+
+def test_null_handling_fill_mean_leaves_all_null_numeric_column():
+    df = pd.DataFrame({'num': [1.0, None, 3.0], 'empty': [float('nan')] * 3, 'cat': ['a', None, 'b']})
+    cfg = {'null_handling': 'fill', 'fill_strategy': 'mean', 'drop_blank_cols': True}
+
+    cleaned, report = clean_dataframe(df.copy(), cfg)
+
+    # no mean exists, so the column stays blank and is dropped; text gets the '' fallback
+    assert 'empty' not in cleaned.columns
+    assert cleaned['cat'].tolist() == ['a', '', 'b']
+    assert report['nulls_filled'] == {'num': 1, 'cat': 1}
+
+
+def test_null_handling_fill_mode_on_all_null_columns():
+    df = pd.DataFrame({
+        'cat': ['a', None, 'a'],
+        'empty_text': pd.array([None, None, None], dtype=object),
+        'empty_num': [float('nan')] * 3,
+    })
+    cfg = {'null_handling': 'fill', 'fill_strategy': 'mode'}
+
+    cleaned, report = clean_dataframe(df.copy(), cfg)
+
+    # no mode exists for an all-null column, so the text/number fallback is used
+    assert cleaned['empty_text'].tolist() == ['', '', '']
+    assert cleaned['empty_num'].tolist() == [0.0, 0.0, 0.0]
+    assert report['nulls_filled'] == {'cat': 1, 'empty_text': 3, 'empty_num': 3}
+
+
+def test_null_handling_fill_constant():
+    df = pd.DataFrame({'cat': ['a', None, 'b'], 'full': ['x', 'y', 'z']})
+    cfg = {'null_handling': 'fill', 'fill_strategy': 'constant', 'fill_constant': 'missing'}
+
+    cleaned, report = clean_dataframe(df.copy(), cfg)
+
+    assert cleaned['cat'].tolist() == ['a', 'missing', 'b']
+    # only columns that had nulls are reported
+    assert report['nulls_filled'] == {'cat': 1}
+
+    # without a constant nothing is filled
+    cleaned, report = clean_dataframe(df.copy(), {**cfg, 'fill_constant': None})
+
+    assert cleaned['cat'].isna().sum() == 1
+    assert report['nulls_filled'] == {}
+
+
+def test_polars_engine_matches_pandas():
+    pytest.importorskip('polars')
+    import pyarrow as pa
+    from utils.cleaner import _clean_polars
+
+    df = pd.DataFrame({
+        'Name': [' Alice ', None, ' Alice ', 'Bob'],
+        'Score': [1.0, None, 1.0, 3.0],
+        'Empty': [None, None, None, None],
+    }, index=[10, 11, 12, 13])
+    # mean 4/3 does not fit the integer column and is skipped; the median 2 does
+    counts = pd.DataFrame({'Count': pd.array([1, None, 2, 1], dtype='Int64')}, index=[10, 11, 12, 13])
+    base = {
+        'trim_whitespace': True,
+        'drop_blank_rows': True,
+        'drop_blank_cols': True,
+        'drop_duplicates': True,
+    }
+    cases = [
+        (df, {}),
+        (df, {'null_handling': 'drop_rows'}),
+        (df.drop(columns='Empty'), {'null_handling': 'fill', 'fill_strategy': 'mode'}),
+        (df.drop(columns='Empty'), {'null_handling': 'fill', 'fill_strategy': 'mean'}),
+        (counts, {'null_handling': 'fill', 'fill_strategy': 'mean'}),
+        (counts, {'null_handling': 'fill', 'fill_strategy': 'median'}),
+    ]
+    # numeric, integer, date and Decimal nulls under every strategy, including
+    # the app's text constant (which only fills text columns)
+    mixed = df.assign(
+        Count=pd.array([1, None, 2, 1], dtype='Int64'),
+        When=pd.to_datetime(['2024-01-01', None, '2024-01-01', '2024-01-03']),
+        Price=pd.array([Decimal('1.5'), None, Decimal('1.5'), Decimal('2')],
+                       dtype=pd.ArrowDtype(pa.decimal128(5, 2))),
+    )
+    # an object column of Decimals is left to pandas (Polars cannot mix in '')
+    decimals = pd.DataFrame({'Price': [Decimal('1.5'), None, Decimal('2')]})
+    for strategy, const in (('constant', 'n/a'), ('constant', 0), ('constant', 1.5),
+                            ('mean', None), ('median', None), ('mode', None)):
+        fill = {'null_handling': 'fill', 'fill_strategy': strategy, 'fill_constant': const}
+        assert _clean_polars(mixed, {**base, **fill}, {}) is not None
+        cases += [(mixed, fill), (decimals, {**fill, 'trim_whitespace': False})]
+    for frame, extra in cases:
+        cfg = {**base, **extra}
+        expected, expected_report = clean_dataframe(frame.copy(), cfg)
+        cleaned, report = clean_dataframe(frame.copy(), {**cfg, 'engine': 'polars'})
+
+        # compare values, not dtypes: Polars hands back Arrow dtypes (NA for NaN)
+        pd.testing.assert_frame_equal(cleaned.astype(object).where(cleaned.notna(), None),
+                                      expected.astype(object).where(expected.notna(), None),
+                                      check_column_type=False, obj=str(extra))
+        for key in ('nulls_dropped', 'nulls_filled', 'blank_rows_dropped',
+                    'blank_cols_dropped', 'duplicates_dropped'):
+            assert report[key] == expected_report[key]
+
+
+def test_text_constant_fill_leaves_other_types_alone():
+    df = pd.DataFrame({
+        'name': ['a', None, 'c'],
+        'age': pd.array([30, None, 40], dtype='Int64'),
+        'score': [1.0, None, 2.0],
+        'when': pd.to_datetime(['2024-01-01', None, '2024-01-03']),
+        'full': ['x', 'y', 'z'],
+    })
+    engines = ['pandas']
+    try:
+        import polars  # noqa: F401
+        engines.append('polars')
+    except ImportError:
+        pass
+    for engine in engines:
+        cfg = {'null_handling': 'fill', 'fill_strategy': 'constant', 'fill_constant': 'n/a', 'engine': engine}
+        cleaned, report = clean_dataframe(df, cfg)
+
+        assert cleaned['name'].tolist() == ['a', 'n/a', 'c']
+        assert pd.api.types.is_integer_dtype(cleaned['age'].dtype)
+        assert pd.api.types.is_float_dtype(cleaned['score'].dtype)
+        assert pd.api.types.is_datetime64_any_dtype(cleaned['when'].dtype)
+        assert cleaned[['age', 'score', 'when']].isna().sum().tolist() == [1, 1, 1]
+        assert report['nulls_filled'] == {'name': 1}
+
+
+def test_outlier_jit_kernels_match_numpy(monkeypatch):
+    pytest.importorskip('numba')
+    import numpy as np
+    from utils import cleaner
+
+    rng = np.random.default_rng(0)
+    mat = rng.normal(size=(200, 4))
+    mat[::5, 1] = np.nan
+    mat[:, 2] = np.nan
+    mat[:, 3] = 1.0
+    mat[7, 0] = 25.0
+
+    for method, thresh in (('iqr', 1.5), ('zscore', 3.0)):
+        expected = cleaner._outlier_mask(mat, method, thresh)
+        monkeypatch.setattr(cleaner, '_JIT_MIN_CELLS', 0)
+        result = cleaner._outlier_mask(mat, method, thresh)
+        monkeypatch.undo()
+        assert np.array_equal(result, expected)
+
+
+def test_polars_engine_outliers_match_pandas():
+    pytest.importorskip('polars')
+    df = pd.DataFrame({
+        'id': list(range(1, 22)),
+        'value': [10.0] * 10 + [11.0] * 10 + [1000.0],
+        'other': [float(i) for i in range(21)],
+    })
+    for method in ('iqr', 'zscore'):
+        cfg = {
+            'drop_duplicates': True,
+            'detect_outliers': True,
+            'outlier_method': method,
+            'outlier_action': 'drop',
+        }
+        expected, expected_report = clean_dataframe(df.copy(), cfg)
+        cleaned, report = clean_dataframe(df.copy(), {**cfg, 'engine': 'polars'})
+
+        assert report['outliers'] == expected_report['outliers']
+        assert report['outliers_removed'] == expected_report['outliers_removed']
+        assert cleaned['value'].tolist() == expected['value'].tolist()
+
+
+def test_outliers_in_large_magnitude_column():
+    # epoch seconds: float32 cannot tell 1.7e9 from 1.7e9 + 60
+    base = 1_700_000_000
+    df = pd.DataFrame({'ts': [base + i % 5 for i in range(40)] + [base + 60]})
+    engines = ['pandas']
+    try:
+        import polars  # noqa: F401
+        engines.append('polars')
+    except ImportError:
+        pass
+    for method in ('iqr', 'zscore'):
+        cfg = {'detect_outliers': True, 'outlier_method': method}
+        for engine in engines:
+            cleaned, report = clean_dataframe(df.copy(), {**cfg, 'engine': engine})
+
+            assert report['outliers']['ts']['count'] == 1, (method, engine)
+
+
+def test_dask_cleaning_matches_pandas():
+    dd = pytest.importorskip('dask.dataframe')
+    from utils.cleaner import clean_dataframe_dask
+
+    df = pd.DataFrame({
+        'Name': [' d ', 'b', None, ' a ', 'c', None, ' a ', 'e', 'b', None] * 5,
+        'Score': [4.0, 2.0, None, 1.0, 3.0, None, 1.0, 5.0, 2.0, 6.0] * 5,
+    })
+    cfg = {
+        'trim_whitespace': True,
+        'drop_blank_rows': True,
+        'drop_duplicates': True,
+        'normalize_columns': True,
+    }
+
+    cases = [
+        cfg,
+        {**cfg, 'null_handling': 'fill', 'fill_strategy': 'mode'},
+        {**cfg, 'null_handling': 'fill', 'fill_strategy': 'mean'},
+        {**cfg, 'null_handling': 'fill', 'fill_strategy': 'constant', 'fill_constant': 'n/a'},
+    ]
+    for case in cases:
+        expected, expected_report = clean_dataframe(df.copy(), case)
+        cleaned, report = clean_dataframe_dask(dd.from_pandas(df, npartitions=3), case)
+
+        # same rows in the same order (the pandas path keeps the input index)
+        pd.testing.assert_frame_equal(cleaned, expected.reset_index(drop=True))
+        for key in ('original_shape', 'col_renames', 'nulls_filled', 'blank_rows_dropped',
+                    'duplicates_dropped', 'rows_removed'):
+            assert report[key] == expected_report[key]
+
+
+def test_input_frame_is_not_modified():
+    df = pd.DataFrame({' Name ': [' Alice ', None, ' Alice '], 'Age': ['30', None, '30']})
+    original = df.copy()
+    cfg = {
+        'normalize_columns': True,
+        'trim_whitespace': True,
+        'null_handling': 'fill',
+        'drop_duplicates': True,
+        'infer_types': True,
+    }
+
+    clean_dataframe(df, cfg)
+
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_infer_types_on_arrow_string_columns():
+    # to_numeric turns unparsable ArrowDtype strings into NaN (not null);
+    # those must not count as parsed numbers
+    df = pd.read_csv(io.BytesIO(b'name,n\nAlice,1\nBob,2\nCarol,3\n'),
+                     engine='pyarrow', dtype_backend='pyarrow')
+    cfg = {'infer_types': True}
+
+    cleaned, report = clean_dataframe(df, cfg)
+
+    assert 'name' not in report['dtype_changes']
+    assert list(cleaned['name']) == ['Alice', 'Bob', 'Carol']
@@ -0,0 +1,56 @@
+import io
+import sys
+import pathlib
+import pandas as pd
+import pytest
+
+# Ensure project root is on sys.path so `utils` can be imported when running tests
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from utils.fileio import read_table, write_xlsx
+
+
+def test_read_excel_mixed_number_text_column():
+    pytest.importorskip('python_calamine')
+    xlsxwriter = pytest.importorskip('xlsxwriter')
+    buf = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buf)
+    sheet = workbook.add_worksheet()
+    sheet.write_row(0, 0, ['code', 'name'])
+    sheet.write_row(1, 0, [123, 'a'])
+    sheet.write_row(2, 0, ['abc', 'b'])
+    workbook.close()
+
+    df = read_table(buf.getvalue(), 'mixed.xlsx')
+
+    # falls back to the default parse instead of failing on the Arrow cast
+    assert df.shape == (2, 2)
+    assert list(df['code']) == [123, 'abc']
+
+
+def test_read_csv_uses_arrow_dtypes():
+    df = read_table(b'name,amount\nAlice,1\nBob,2\n', 'data.csv')
+
+    assert isinstance(df['amount'].dtype, pd.ArrowDtype)
+    assert list(df['name']) == ['Alice', 'Bob']
+
+
+def test_write_xlsx_handles_missing_datetimes_and_inf():
+    pytest.importorskip('xlsxwriter')
+    calamine = pytest.importorskip('python_calamine')
+    df = pd.DataFrame({
+        'name': pd.array(['a', None, 'c'], dtype='string[pyarrow]'),
+        'count': pd.array([1, None, 3], dtype='Int64'),
+        'ratio': [1.5, float('inf'), float('-inf')],
+        'when': pd.to_datetime(['2024-01-01 10:00', None, '2024-01-03 00:00'], utc=True),
+    })
+
+    buf = write_xlsx(df, sheet_name='cleaned')
+
+    rows = calamine.CalamineWorkbook.from_filelike(buf).get_sheet_by_name('cleaned').to_python()
+    assert rows[0] == ['name', 'count', 'ratio', 'when']
+    assert rows[1][:3] == ['a', 1, 1.5]
+    # missing values are empty cells; tz-aware datetimes are written as local times
+    assert rows[2][0] == rows[2][1] == rows[2][3] == ''
+    assert str(rows[1][3]).startswith('2024-01-01 10:00')
+    # infinities become Excel error cells (read back empty) instead of aborting the export
+    assert rows[2][2] == rows[3][2] == ''
@@ -1,14 +1,538 @@
+import decimal
+import functools
+import numbers
 import re
 from typing import Tuple, Dict, Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; outlier masks fall back to numpy
+    njit = None
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^0-9a-zA-Z_]+")
+_ID_RE = re.compile(r'(?i)(?:^id$|_id$|^id_)')
+_ALPHA_RUN_PATTERN = r'[A-Za-z]{3,}'
+
+
+def _normalize_column_names(columns: pd.Index) -> list:
+    names = pd.Index(columns).astype(str).str.strip()
+    names = names.str.replace(_WS_RE, "_", regex=True)
+    names = names.str.replace(_PUNCT_RE, "", regex=True)
+    return list(names.str.lower())
+
+
+def _count_date_like(values: pd.Series) -> int:
+    """Counts values that look like dates: containing a / - . separator or a
+    run of three or more letters (e.g. a month name)."""
+    arr = pa.array(values.astype('string[pyarrow]'))
+    # literal substring kernels for the separators, no regex engine involved
+    hits = pc.or_(pc.match_substring(arr, '/'), pc.match_substring(arr, '-'))
+    hits = pc.or_(hits, pc.match_substring(arr, '.'))
+    # only the remaining values need Arrow's (RE2) regex kernel
+    rest = arr.filter(pc.invert(hits))
+    letters = pc.match_substring_regex(rest, _ALPHA_RUN_PATTERN)
+    return (pc.sum(hits).as_py() or 0) + (pc.sum(letters).as_py() or 0)
+
+
+def _to_arrow_strings(df: pd.DataFrame, cols: list) -> pd.DataFrame:
+    """Converts cols to Arrow-backed strings with a single astype call."""
+    try:
+        df[cols] = df[cols].astype('string[pyarrow]')
+    except Exception:
+        # As a last resort, coerce to python str
+        for c in cols:
+            df[c] = df[c].astype(str)
+    return df
+
+
+def _parse_datetimes(series: pd.Series, min_ratio: float) -> pd.Series:
+    """Parses series as datetimes, coercing failures to NaT.
+
+    The fast ISO 8601 parser is tried first; the per-value 'mixed' parser only
+    runs when ISO parsing leaves fewer than min_ratio of the values parsed.
+    """
+    conv = pd.to_datetime(series, errors='coerce', format='ISO8601')
+    if conv.notna().sum() / max(1, len(series)) < min_ratio:
+        conv = pd.to_datetime(series, errors='coerce', format='mixed')
+    return conv
+
+
+# Matrices smaller than this use numpy; JIT dispatch only pays off on large blocks
+_JIT_MIN_CELLS = 1_000_000
+# Largest magnitude below which float32 still represents every integer exactly
+_FLOAT32_EXACT = 2 ** 24
+
+if njit is not None:
+    # fastmath without 'nnan'/'ninf' so the NaN checks below are not optimized away
+    _JIT_OPTS = dict(parallel=True, fastmath={'reassoc', 'contract', 'arcp'}, cache=True)
+
+    @njit(**_JIT_OPTS)
+    def _zscore_mask_jit(mat, thresh):
+        nrows, ncols = mat.shape
+        out = np.zeros((nrows, ncols), dtype=np.bool_)
+        for j in prange(ncols):
+            # single-pass (Welford) mean/variance over the non-NaN values
+            n = 0
+            mu = 0.0
+            m2 = 0.0
+            for i in range(nrows):
+                x = mat[i, j]
+                if x == x:
+                    n += 1
+                    delta = x - mu
+                    mu += delta / n
+                    m2 += delta * (x - mu)
+            if n == 0:
+                continue
+            sigma = np.sqrt(m2 / n)
+            if not sigma > 0:
+                continue
+            for i in range(nrows):
+                out[i, j] = abs((mat[i, j] - mu) / sigma) > thresh
+        return out
+
+    @njit(**_JIT_OPTS)
+    def _iqr_mask_jit(mat, thresh):
+        nrows, ncols = mat.shape
+        out = np.zeros((nrows, ncols), dtype=np.bool_)
+        for j in prange(ncols):
+            col = mat[:, j]
+            vals = np.sort(col[~np.isnan(col)])
+            n = vals.size
+            if n == 0:
+                continue
+            # linear interpolation, matching np.nanquantile's default method
+            bounds = np.empty(2)
+            for k, q in enumerate((0.25, 0.75)):
+                pos = q * (n - 1)
+                lo = int(np.floor(pos))
+                hi = min(lo + 1, n - 1)
+                bounds[k] = vals[lo] + (pos - lo) * (vals[hi] - vals[lo])
+            iqr = bounds[1] - bounds[0]
+            lower = bounds[0] - thresh * iqr
+            upper = bounds[1] + thresh * iqr
+            for i in range(nrows):
+                out[i, j] = col[i] < lower or col[i] > upper
+        return out
+
+
+def _outlier_mask(mat: np.ndarray, method: str, thresh: float) -> np.ndarray:
+    """Returns a boolean matrix flagging outlier cells of a (rows, cols) float
+    matrix, column by column. NaN cells and all-NaN columns are never flagged."""
+    if njit is not None and mat.size >= _JIT_MIN_CELLS:
+        # column-major layout keeps each column contiguous for the kernels
+        mat = np.asfortranarray(mat)
+        if method == 'iqr':
+            return _iqr_mask_jit(mat, thresh)
+        return _zscore_mask_jit(mat, thresh)
+
+    mask = np.zeros(mat.shape, dtype=bool)
+    has_data = ~np.isnan(mat).all(axis=0)
+    if not has_data.any():
+        return mask
+    # Without all-NaN columns (the common case) work on mat and write into mask
+    # directly; the elementwise steps below reuse preallocated buffers via out=
+    full = has_data.all()
+    sub = mat if full else mat[:, has_data]
+    hit = mask if full else np.empty(sub.shape, dtype=bool)
+
+    if method == 'iqr':
+        q1, q3 = np.nanquantile(sub, [0.25, 0.75], axis=0)
+        iqr = q3 - q1
+        above = np.empty(sub.shape, dtype=bool)
+        np.less(sub, q1 - thresh * iqr, out=hit)
+        np.greater(sub, q3 + thresh * iqr, out=above)
+        np.logical_or(hit, above, out=hit)
+    else:  # zscore
+        mu = np.nanmean(sub, axis=0)
+        sigma = np.nanstd(sub, axis=0)
+        valid = sigma > 0
+        z = np.subtract(sub, mu)
+        np.abs(z, out=z)
+        np.divide(z, np.where(valid, sigma, 1.0), out=z)
+        np.greater(z, thresh, out=hit)
+        np.logical_and(hit, valid, out=hit)
+
+    if not full:
+        mask[:, has_data] = hit
+    return mask
+
+
+def _trim_step(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]) -> pd.DataFrame:
+    # Trim whitespace in text columns. Casting to Arrow-backed strings keeps nulls
+    # as nulls and lets str.strip dispatch to Arrow's utf8_trim_whitespace kernel.
+    # select_dtypes' 'string' also matches non-text Arrow types such as decimals
+    obj_cols = [c for c, t in df.dtypes.items() if t == object or pd.api.types.is_string_dtype(t)]
+    for c in obj_cols:
+        try:
+            df[c] = df[c].astype('string[pyarrow]').str.strip()
+        except Exception:
+            # leave column unchanged on failure
+            pass
+    return df
+
+
+def _drop_null_rows_step(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]) -> pd.DataFrame:
+    before = len(df)
+    df = df.dropna(how='any')
+    report['nulls_dropped'] = before - len(df)
+    return df
+
+
+def _fallback_fill(dtype) -> Any:
+    """Fill used when a column has no statistic: empty string for text, 0 for numerics."""
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        return ''
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        return 0
+    return None
+
+
+def _fill_fits(dtype, value) -> bool:
+    """Whether a column of dtype can take value without changing its type.
+
+    Object columns take anything; a fractional number never goes into an
+    integer column (Arrow integer columns would silently truncate it).
+    """
+    if dtype == object:
+        return True
+    if pd.api.types.is_bool_dtype(dtype):
+        return isinstance(value, (bool, np.bool_))
+    if pd.api.types.is_string_dtype(dtype):
+        return isinstance(value, str)
+    if pd.api.types.is_numeric_dtype(dtype):
+        if isinstance(value, (bool, np.bool_)) or not isinstance(value, numbers.Number):
+            return False
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_decimal(dtype.pyarrow_dtype):
+            # Arrow decimals only take exact values, not floats
+            return isinstance(value, (numbers.Integral, decimal.Decimal))
+        return not pd.api.types.is_integer_dtype(dtype) or float(value).is_integer()
+    return False
+
+
+def _decimal_stat(dtype, value) -> Any:
+    """pandas returns the median of an Arrow decimal column as a float; turn
+    it back into a Decimal so it can fill the column."""
+    arrow_decimal = isinstance(dtype, pd.ArrowDtype) and pa.types.is_decimal(dtype.pyarrow_dtype)
+    if arrow_decimal and isinstance(value, float):
+        return decimal.Decimal(repr(value))
+    return value
+
+
+def _fill_plan(dtypes: pd.Series, config: Dict[str, Any]) -> Dict[str, tuple]:
+    """Decides how each column in dtypes is filled, shared by every engine.
+
+    Maps a column to (stat, literal): stat is 'mean', 'median' or 'mode' when
+    the engine should compute that statistic for the column, and literal is
+    used when there is no statistic or it comes out null. Columns that are
+    left alone are absent. A constant only goes into columns that can hold it
+    (see _fill_fits), so a text constant leaves numeric and date columns
+    alone. Mean/median fall back to the text/numeric default for non-numeric
+    columns, as does mode for a column without a mode.
+    """
+    strategy = config.get('fill_strategy', 'mode')
+    const = config.get('fill_constant', None)
+    plan = {}
+    for c, dtype in dtypes.items():
+        numeric = pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        if strategy in ('mean', 'median') and numeric:
+            plan[c] = (strategy, None)
+        elif strategy == 'mode':
+            plan[c] = ('mode', _fallback_fill(dtype))
+        elif strategy == 'constant':
+            if const is not None and _fill_fits(dtype, const):
+                plan[c] = (None, const)
+        elif _fallback_fill(dtype) is not None:
+            plan[c] = (None, _fallback_fill(dtype))
+    return plan
+
+
+def _fill_nulls_step(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]) -> pd.DataFrame:
+    # fill_strategy: 'mean'|'median'|'mode'|'constant'; fill_constant used when strategy == 'constant'
+    # Fill values for every column with nulls are computed with one
+    # frame-level reduction and applied with a single fillna call
+    na_counts = df.isna().sum()
+    null_df = df[na_counts.index[na_counts > 0]]
+    plan = _fill_plan(null_df.dtypes, config)
+    stats = {}
+    for stat in ('mean', 'median', 'mode'):
+        cols = [c for c, (s, _) in plan.items() if s == stat]
+        if not cols:
+            continue
+        if stat == 'mode':
+            modes = null_df[cols].mode(dropna=True)
+            if not modes.empty:
+                stats.update(modes.iloc[0].dropna().to_dict())
+        else:
+            stats.update(getattr(null_df[cols], stat)().dropna().to_dict())
+
+    fill_map = {}
+    for c, (stat, literal) in plan.items():
+        val = _decimal_stat(null_df.dtypes[c], stats.get(c, literal))
+        # only a mean/median can miss the column's type (a fractional value
+        # for an integer column); modes are the column's own values
+        if val is not None and (stat not in ('mean', 'median') or _fill_fits(null_df.dtypes[c], val)):
+            fill_map[c] = val
+
+    try:
+        df = df.fillna(fill_map)
+    except (TypeError, ValueError):
+        # a value the column still cannot hold; fill column by column and
+        # skip the ones that fail
+        for c, val in list(fill_map.items()):
+            try:
+                df[c] = df[c].fillna(val)
+            except (TypeError, ValueError):
+                del fill_map[c]
+
+    report['nulls_filled'] = {c: int(na_counts[c]) for c in fill_map}
+    return df
+
+
+def _drop_blank_step(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]) -> pd.DataFrame:
+    # Drop completely blank rows and columns. Both masks come from one isna()
+    # matrix: removing blank rows never changes which columns are blank.
+    drop_rows = config.get('drop_blank_rows')
+    drop_cols = config.get('drop_blank_cols')
+    na_mat = df.isna().to_numpy()
+    row_keep = ~na_mat.all(axis=1) if drop_rows else np.ones(len(df), dtype=bool)
+    col_keep = ~na_mat.all(axis=0) if drop_cols else np.ones(df.shape[1], dtype=bool)
+    df = df.iloc[row_keep, col_keep]
+    report['blank_rows_dropped'] = int((~row_keep).sum())
+    report['blank_cols_dropped'] = int((~col_keep).sum())
+    return df
+
+
+def _dedup_step(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]) -> pd.DataFrame:
+    before = len(df)
+    df = df.drop_duplicates()
+    report['duplicates_dropped'] = before - len(df)
+    return df
+
+
+_PLAN_FLAGS = ('trim_whitespace', 'drop_blank_rows', 'drop_blank_cols', 'drop_duplicates')
+
+
+def _plan_key(config: Dict[str, Any]) -> tuple:
+    """Hashable summary of the config entries that choose the pandas steps.
+
+    Flags go through bool() so truthy values of any type (e.g. numpy bools)
+    enable their step, as config.get() checks do elsewhere.
+    """
+    null_handling = config.get('null_handling')
+    if null_handling not in ('drop_rows', 'fill'):
+        null_handling = None
+    return tuple(bool(config.get(k)) for k in _PLAN_FLAGS) + (null_handling,)
+
+
+@functools.lru_cache(maxsize=64)
+def _pandas_plan(key: tuple) -> tuple:
+    """Resolves a plan key to the ordered pandas steps it enables, so the flag
+    checks run once per distinct config rather than on every call (the Dask
+    path calls _clean_pandas once per partition and step)."""
+    trim, blank_rows, blank_cols, dedup, null_handling = key
+    steps = []
+    if trim:
+        steps.append(_trim_step)
+    # null_handling: 'none'|'drop_rows'|'fill'
+    if null_handling == 'drop_rows':
+        steps.append(_drop_null_rows_step)
+    elif null_handling == 'fill':
+        steps.append(_fill_nulls_step)
+    if blank_rows or blank_cols:
+        steps.append(_drop_blank_step)
+    if dedup:
+        steps.append(_dedup_step)
+    return tuple(steps)
+
+
+def _clean_pandas(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]) -> pd.DataFrame:
+    """Runs trimming, null handling, blank row/column removal and de-duplication
+    with eager pandas operations, recording counts in report."""
+    report.update(nulls_dropped=0, nulls_filled={}, blank_rows_dropped=0,
+                  blank_cols_dropped=0, duplicates_dropped=0)
+    for step in _pandas_plan(_plan_key(config)):
+        df = step(df, config, report)
+    return df
+
+
+def _clean_polars(df: pd.DataFrame, config: Dict[str, Any], report: Dict[str, Any]):
+    """Runs the same steps as _clean_pandas as a single lazy Polars query.
+
+    Every enabled step, including outlier detection when no type inference is
+    requested, is chained onto one LazyFrame and executed with a single
+    collect_all call, so Polars can fuse the passes and share the common
+    sub-plans behind the report counters. Returns None when the frame cannot be
+    represented in Polars (mixed-type object columns, non-string or duplicate
+    column names) so the caller can fall back to pandas.
+
+    The input index is carried through, so surviving rows keep their labels.
+    Null filling follows the same _fill_plan as the pandas path; frames where
+    pandas would mix a fill value into an object column are left to pandas.
+    """
+    import polars as pl
+
+    if not df.columns.is_unique or not all(isinstance(c, str) for c in df.columns):
+        return None
+    try:
+        lf = pl.from_pandas(df, rechunk=True).lazy()
+    except Exception:
+        return None
+    schema = lf.collect_schema()
+    if config.get('trim_whitespace') and any(
+            df.dtypes[c] == object and schema[c] not in (pl.String, pl.Null) for c in df.columns):
+        # pandas' trim turns every object column into strings (Decimals, dates
+        # and numbers included); Polars would keep their types
+        return None
+
+    # Row positions ride along so the pandas index can be restored at the end;
+    # every step below works on the data columns only
+    row_col = '__row_nr__'
+    while row_col in schema:
+        row_col = '_' + row_col
+    lf = lf.with_row_index(row_col)
+    data_cols = pl.exclude(row_col)
+
+    # Single-row plans evaluated alongside the result for the report counters
+    probes = {}
+
+    # Trim whitespace in string columns
+    if config.get('trim_whitespace'):
+        str_cols = [c for c, t in schema.items() if t == pl.String]
+        if str_cols:
+            lf = lf.with_columns(pl.col(str_cols).str.strip_chars())
+
+    # NULL handling (same config keys as the pandas path)
+    null_handling = config.get('null_handling', 'none')
+    if null_handling == 'drop_rows':
+        probes['rows_before_nulls'] = lf.select(pl.len())
+        lf = lf.drop_nulls()
+        probes['rows_after_nulls'] = lf.select(pl.len())
+    elif null_handling == 'fill':
+        # The pandas path trims text columns into Arrow strings before filling
+        dtypes = df.dtypes.copy()
+        if config.get('trim_whitespace'):
+            text = [c for c, t in dtypes.items() if t == object or pd.api.types.is_string_dtype(t)]
+            dtypes[text] = pd.StringDtype('pyarrow')
+        probes['nulls_before_fill'] = lf.select(data_cols.null_count())
+        fills = []
+        for c, (stat, literal) in _fill_plan(dtypes, config).items():
+            dtype = schema[c]
+            text_fill = dtype in (pl.String, pl.Null) and isinstance(literal, (str, type(None)))
+            if df.dtypes[c] == object and not text_fill:
+                # pandas fills an object column with any value, mixing types;
+                # a Polars column cannot, so leave the frame to the pandas path
+                return None
+            col = pl.col(c)
+            lit = None
+            if literal is not None:
+                lit = pl.lit(literal) if dtype == pl.Null else pl.lit(literal).cast(dtype)
+            if stat in ('mean', 'median'):
+                val = getattr(col, stat)()
+                if dtype.is_integer():
+                    # only an integral value fits; otherwise fill with null (no-op)
+                    val = pl.when(val == val.round()).then(val)
+                fills.append(col.fill_null(val.cast(dtype)))
+            elif stat == 'mode':
+                # pandas returns modes sorted, so take the smallest on ties
+                mode_val = col.drop_nulls().mode().sort().first()
+                fills.append(pl.coalesce(col, mode_val, lit) if lit is not None else col.fill_null(mode_val))
+            elif lit is not None:
+                fills.append(col.fill_null(lit))
+        if fills:
+            lf = lf.with_columns(fills)
+        probes['nulls_after_fill'] = lf.select(data_cols.null_count())
 
+    # Drop completely blank rows
+    if config.get('drop_blank_rows'):
+        probes['rows_before_blank'] = lf.select(pl.len())
+        lf = lf.filter(~pl.all_horizontal(data_cols.is_null()))
+        probes['rows_after_blank'] = lf.select(pl.len())
+
+    # Blank columns do not affect blank-row or duplicate detection, so they are
+    # only identified here and projected away after the collect
+    if config.get('drop_blank_cols'):
+        probes['blank_cols'] = lf.select(data_cols.is_null().all())
+
+    # Drop duplicates
+    if config.get('drop_duplicates'):
+        probes['rows_before_dupes'] = lf.select(pl.len())
+        lf = lf.unique(subset=list(schema.names()), keep='first', maintain_order=True)
+        probes['rows_after_dupes'] = lf.select(pl.len())
+
+    # Outlier detection joins the same plan unless type inference has to run
+    # first (it decides dtypes from the data, so it needs a materialized frame)
+    outlier_cols = []
+    if config.get('detect_outliers') and not config.get('infer_types'):
+        method = config.get('outlier_method', 'iqr')
+        thresh = float(config.get('outlier_threshold', 1.5 if method == 'iqr' else 3.0))
+        masks = []
+        for c, dtype in lf.collect_schema().items():
+            if c == row_col or not dtype.is_numeric() or _ID_RE.search(c):
+                continue
+            col = pl.col(c).cast(pl.Float64)
+            if method == 'iqr':
+                q1 = col.quantile(0.25, interpolation='linear')
+                q3 = col.quantile(0.75, interpolation='linear')
+                mask = (col < q1 - thresh * (q3 - q1)) | (col > q3 + thresh * (q3 - q1))
+            else:  # zscore
+                sigma = col.std(ddof=0)
+                mask = pl.when(sigma > 0).then(((col - col.mean()) / sigma).abs() > thresh).otherwise(False)
+            masks.append(mask.fill_null(False).alias(c))
+            outlier_cols.append(c)
+        probes['rows_before_outliers'] = lf.select(pl.len())
+        if masks:
+            probes['outlier_counts'] = lf.select([m.sum() for m in masks])
+            if config.get('outlier_action', 'report') == 'drop':
+                lf = lf.filter(~pl.any_horizontal(masks))
+        probes['rows_after_outliers'] = lf.select(pl.len())
+
+    names = list(probes)
+    frames = pl.collect_all([lf] + [probes[n] for n in names], engine='streaming')
+    out = frames[0]
+    results = {n: frames[i + 1].row(0) for i, n in enumerate(names)}
 
-def _normalize_column_name(name: str) -> str:
-    name = str(name).strip()
-    name = re.sub(r"\s+", "_", name)
-    name = re.sub(r"[^0-9a-zA-Z_]+", "", name)
-    return name.lower()
+    report['nulls_dropped'] = 0
+    report['nulls_filled'] = {}
+    if 'rows_after_nulls' in results:
+        report['nulls_dropped'] = results['rows_before_nulls'][0] - results['rows_after_nulls'][0]
+    if 'nulls_after_fill' in results:
+        filled = zip(schema.names(), results['nulls_before_fill'], results['nulls_after_fill'])
+        report['nulls_filled'] = {c: before - after for c, before, after in filled if before > after}
+
+    report['blank_rows_dropped'] = 0
+    if 'rows_after_blank' in results:
+        report['blank_rows_dropped'] = results['rows_before_blank'][0] - results['rows_after_blank'][0]
+
+    report['blank_cols_dropped'] = 0
+    if 'blank_cols' in results:
+        blank = [c for c, is_blank in zip(schema.names(), results['blank_cols']) if is_blank]
+        out = out.drop(blank)
+        report['blank_cols_dropped'] = len(blank)
+
+    report['duplicates_dropped'] = 0
+    if 'rows_after_dupes' in results:
+        report['duplicates_dropped'] = results['rows_before_dupes'][0] - results['rows_after_dupes'][0]
+
+    if 'rows_after_outliers' in results:
+        rows = results['rows_before_outliers'][0]
+        counts = results.get('outlier_counts', ())
+        report['outliers'] = {
+            c: {'count': int(n), 'percent': float(n) / max(1, rows)}
+            for c, n in zip(outlier_cols, counts)
+            if c in out.columns
+        }
+        report['outliers_removed'] = rows - results['rows_after_outliers'][0]
+
+    result = out.drop(row_col).to_pandas(use_pyarrow_extension_array=True)
+    result.index = df.index[out[row_col].to_numpy()]
+    return result
 
 
 def clean_dataframe(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
@@ -22,9 +546,14 @@ def clean_dataframe(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFr
       - normalize_columns: bool
       - infer_types: bool
       - date_detect_thresh: float (0-1)
+      - engine: 'pandas' (default) | 'polars'
 
-    Report contains counts and column/dtype changes.
+    Report contains counts and column/dtype changes. The input DataFrame is
+    left unchanged.
     """
+    # The caller's frame is never modified: steps below assign columns on this
+    # shallow copy, and under Copy-on-Write only the columns written get copied
+    df = df.copy(deep=False)
     report = {}
     original_shape = df.shape
     report['original_shape'] = original_shape
@@ -32,130 +561,67 @@ def clean_dataframe(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFr
     # Normalize column names
     col_renames = {}
     if config.get('normalize_columns'):
-        new_cols = [_normalize_column_name(c) for c in df.columns]
+        new_cols = _normalize_column_names(df.columns)
         for old, new in zip(df.columns, new_cols):
             if old != new:
                 col_renames[old] = new
         df.columns = new_cols
     report['col_renames'] = col_renames
 
-    # Trim whitespace in object columns
-    if config.get('trim_whitespace'):
-        obj_cols = df.select_dtypes(include=['object']).columns
-        for c in obj_cols:
-            # guard: skip if all null
-            try:
-                df[c] = df[c].astype(str).where(df[c].notna(), None)
-                df[c] = df[c].str.strip()
-            except Exception:
-                # leave column unchanged on failure
-                pass
-
-    # NULL handling: drop or fill nulls per configuration
-    # Config keys (optional): null_handling: 'none'|'drop_rows'|'fill'
-    # If 'fill' then fill_strategy: 'mean'|'median'|'mode'|'constant' and fill_constant used when strategy == 'constant'
-    null_handling = config.get('null_handling', 'none')
-    report['nulls_dropped'] = 0
-    report['nulls_filled'] = {}
-    if null_handling == 'drop_rows':
-        before = len(df)
-        df = df.dropna(how='any')
-        report['nulls_dropped'] = before - len(df)
-    elif null_handling == 'fill':
-        strategy = config.get('fill_strategy', 'mode')
-        const = config.get('fill_constant', None)
-        filled_counts = {}
-        for c in df.columns:
-            col = df[c]
-            na_count = col.isna().sum()
-            if na_count == 0:
-                continue
-            try:
-                if strategy == 'mean' and pd.api.types.is_numeric_dtype(col):
-                    val = col.mean()
-                    df[c] = col.fillna(val)
-                elif strategy == 'median' and pd.api.types.is_numeric_dtype(col):
-                    val = col.median()
-                    df[c] = col.fillna(val)
-                elif strategy == 'mode':
-                    mode_vals = col.mode(dropna=True)
-                    if not mode_vals.empty:
-                        val = mode_vals.iloc[0]
-                        df[c] = col.fillna(val)
-                    else:
-                        df[c] = col.fillna('') if col.dtype == object else col.fillna(0)
-                elif strategy == 'constant':
-                    df[c] = col.fillna(const)
-                else:
-                    # Fallback: fill with empty string for objects, 0 for numerics
-                    df[c] = col.fillna('') if col.dtype == object else col.fillna(0)
-
-                filled_counts[c] = na_count
-            except Exception:
-                # leave as-is on failure
-                continue
-
-        report['nulls_filled'] = filled_counts
-
-    # Drop completely blank rows
-    if config.get('drop_blank_rows'):
-        before = len(df)
-        df = df.dropna(how='all')
-        report['blank_rows_dropped'] = before - len(df)
-    else:
-        report['blank_rows_dropped'] = 0
-
-    # Drop completely blank columns
-    if config.get('drop_blank_cols'):
-        before = df.shape[1]
-        df = df.dropna(axis=1, how='all')
-        report['blank_cols_dropped'] = before - df.shape[1]
-    else:
-        report['blank_cols_dropped'] = 0
-
-    # Drop duplicates
-    if config.get('drop_duplicates'):
-        before = len(df)
-        df = df.drop_duplicates()
-        report['duplicates_dropped'] = before - len(df)
-    else:
-        report['duplicates_dropped'] = 0
+    # Structural cleaning: trim, nulls, blank rows/columns, duplicates
+    cleaned = None
+    if config.get('engine') == 'polars':
+        cleaned = _clean_polars(df, config, report)
+    df = cleaned if cleaned is not None else _clean_pandas(df, config, report)
 
     # Infer numeric/date types
     dtype_changes = {}
+    # to_numeric results per column, reused by the Arrow-compatibility pass below
+    numeric_cache = {}
     if config.get('infer_types'):
         thresh = float(config.get('date_detect_thresh', 0.5))
         for c in df.columns:
             series = df[c]
             old_dtype = str(series.dtype)
 
-            # skip if empty
+            # skip if empty or already typed
             if series.dropna().empty:
                 continue
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+                continue
+            if isinstance(series.dtype, pd.ArrowDtype) and pd.api.types.is_string_dtype(series.dtype):
+                # to_numeric on ArrowDtype strings coerces failures to NaN rather
+                # than null, which notna() would count as parsed
+                series = series.astype('string[pyarrow]')
 
             # Try numeric
+            num_ratio = 0.0
             try:
                 conv = pd.to_numeric(series, errors='coerce')
-                non_null = conv.notna().sum()
-                if non_null / max(1, len(series)) >= 0.9:
+                numeric_cache[c] = conv
+                num_ratio = conv.notna().sum() / max(1, len(series))
+                if num_ratio >= 0.9:
                     df[c] = conv
                     dtype_changes[c] = {'from': old_dtype, 'to': 'numeric'}
                     continue
             except Exception:
                 pass
 
+            # Mostly-numeric columns are not dates; skip the (slow) datetime parse
+            if num_ratio >= 0.5:
+                continue
+
             # Try datetime
             try:
                 # Only attempt to parse as datetime when many values look date-like
-                non_na = series.dropna().astype(str)
+                non_na = series.dropna()
                 if not non_na.empty:
-                    # date-like = contains separators like / - . or month names
-                    date_like_count = non_na.str.contains(r'[/\\-.]|[A-Za-z]{3,}', regex=True).sum()
+                    date_like_count = _count_date_like(non_na)
                     if date_like_count / max(1, len(non_na)) < thresh:
                         # not enough date-like values; skip datetime detection
                         continue
 
-                conv = pd.to_datetime(series, errors='coerce', infer_datetime_format=True)
+                conv = _parse_datetimes(series, thresh)
                 non_null = conv.notna().sum()
                 if non_null / max(1, len(series)) >= thresh:
                     df[c] = conv
@@ -172,97 +638,83 @@ def clean_dataframe(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFr
     # - try datetime if almost all values parse as datetimes
     # - otherwise convert to pandas' string dtype to avoid pyarrow trying to coerce to int
     def _make_arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
-        for c in df.columns:
+        string_cols = []
+        # Only act on object dtype (ambiguous / mixed types)
+        for c in df.columns[df.dtypes == object]:
             ser = df[c]
-            # Only act on object dtype (ambiguous / mixed types)
-            if ser.dtype == 'object':
-                # Try numeric if most values can be parsed
-                try:
+            # Try numeric if most values can be parsed
+            try:
+                conv = numeric_cache.get(c)
+                if conv is None:
                     conv = pd.to_numeric(ser, errors='coerce')
-                    non_null = conv.notna().sum()
-                    if non_null / max(1, len(ser)) >= 0.95:
-                        df[c] = conv
-                        continue
-                except Exception:
-                    pass
-
-                # Try datetime if most values can be parsed
-                try:
-                    non_na = ser.dropna().astype(str)
-                    date_like = 0
-                    if not non_na.empty:
-                        date_like = non_na.str.contains(r'[/\\-.]|[A-Za-z]{3,}', regex=True).sum()
-
-                    # require most non-null values to be date-like before coercing
-                    if date_like / max(1, len(non_na)) < 0.95:
-                        raise ValueError("Not enough date-like values")
-
-                    conv = pd.to_datetime(ser, errors='coerce', infer_datetime_format=True)
-                    non_null = conv.notna().sum()
-                    if non_null / max(1, len(ser)) >= 0.95:
-                        df[c] = conv
-                        continue
-                except Exception:
-                    pass
-
-                # Fallback: convert to pandas string dtype (explicit, works with pyarrow)
-                try:
-                    df[c] = ser.astype("string")
-                except Exception:
-                    # As a last resort, coerce to python str
-                    df[c] = ser.astype(str)
+                non_null = conv.notna().sum()
+                if non_null / max(1, len(ser)) >= 0.95:
+                    df[c] = conv
+                    continue
+            except Exception:
+                pass
+
+            # Try datetime if most values can be parsed
+            try:
+                non_na = ser.dropna()
+                date_like = _count_date_like(non_na) if not non_na.empty else 0
+
+                # require most non-null values to be date-like before coercing
+                if date_like / max(1, len(non_na)) < 0.95:
+                    raise ValueError("Not enough date-like values")
+
+                conv = _parse_datetimes(ser, 0.95)
+                non_null = conv.notna().sum()
+                if non_null / max(1, len(ser)) >= 0.95:
+                    df[c] = conv
+                    continue
+            except Exception:
+                pass
+
+            string_cols.append(c)
+
+        # Fallback: convert the rest to Arrow-backed strings in one batch
+        if string_cols:
+            df = _to_arrow_strings(df, string_cols)
         return df
 
-    df = _make_arrow_compatible(df)
+    # Arrow-backed input (e.g. read with dtype_backend="pyarrow") has no object columns
+    if (df.dtypes == object).any():
+        df = _make_arrow_compatible(df)
 
     # Outlier detection / removal (operates on numeric columns)
     # Config keys: detect_outliers: bool, outlier_method: 'iqr'|'zscore',
     # outlier_threshold: float (multiplier for IQR or z-score cutoff), outlier_action: 'report'|'drop'
-    report['outliers'] = {}
-    report['outliers_removed'] = 0
-    if config.get('detect_outliers'):
+    outliers_done = 'outliers' in report  # already applied by the Polars plan
+    report.setdefault('outliers', {})
+    report.setdefault('outliers_removed', 0)
+    if config.get('detect_outliers') and not outliers_done:
         method = config.get('outlier_method', 'iqr')
         thresh = float(config.get('outlier_threshold', 1.5 if method == 'iqr' else 3.0))
         action = config.get('outlier_action', 'report')
 
         # Exclude identifier-like columns from outlier detection (e.g. 'id', 'user_id', 'id_number')
         # Assumption: columns labeled exactly 'id' or those starting/ending with 'id_' or '_id' should be skipped.
-        numeric_cols = [
-            c for c in df.select_dtypes(include=['number']).columns
-            if not re.search(r'(?i)(?:^id$|_id$|^id_)', str(c))
-        ]
-        # Keep mask of rows to remove if requested
-        removal_mask = pd.Series(False, index=df.index)
-
-        for c in numeric_cols:
-            ser = df[c].dropna()
-            if ser.empty:
-                report['outliers'][c] = {'count': 0, 'percent': 0.0}
-                continue
-
-            if method == 'iqr':
-                q1 = ser.quantile(0.25)
-                q3 = ser.quantile(0.75)
-                iqr = q3 - q1
-                lower = q1 - thresh * iqr
-                upper = q3 + thresh * iqr
-                mask = (df[c] < lower) | (df[c] > upper)
-            else:  # zscore
-                mu = ser.mean()
-                sigma = ser.std(ddof=0)
-                if sigma == 0 or pd.isna(sigma):
-                    mask = pd.Series(False, index=df.index)
-                else:
-                    z = (df[c] - mu) / sigma
-                    mask = z.abs() > thresh
-
-            count = int(mask.sum())
+        numeric_cols = df.select_dtypes(include=['number']).columns
+        numeric_cols = numeric_cols[~numeric_cols.astype(str).str.contains(_ID_RE)]
+        # Stack the numeric columns into one float matrix so the statistics for
+        # every column come from a single vectorized pass. float32 halves the
+        # bytes scanned but only resolves steps of 1 up to 2**24, so larger
+        # values (e.g. epoch seconds) are compared in float64 instead.
+        mat = df[numeric_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+        largest = max(np.fmax.reduce(mat, axis=None), -np.fmin.reduce(mat, axis=None)) if mat.size else 0.0
+        if largest >= _FLOAT32_EXACT:
+            mat = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        col_mask = _outlier_mask(mat, method, thresh)
+        counts = col_mask.sum(axis=0)
+
+        for c, count in zip(numeric_cols, counts):
+            count = int(count)
             percent = float(count) / max(1, len(df))
             report['outliers'][c] = {'count': count, 'percent': percent}
-            if action == 'drop' and count > 0:
-                removal_mask = removal_mask | mask.fillna(False)
 
         if action == 'drop':
+            removal_mask = col_mask.any(axis=1)
             before = len(df)
             df = df.loc[~removal_mask]
             report['outliers_removed'] = before - len(df)
@@ -270,9 +722,8 @@ def clean_dataframe(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFr
         # Defensive: ensure identifier-like columns are not included in outlier report
         # (in case any identifier columns were present in report due to previous logic)
         try:
-            id_pattern = re.compile(r'(?i)(?:^id$|_id$|^id_)')
             for k in list(report.get('outliers', {}).keys()):
-                if id_pattern.search(str(k)):
+                if _ID_RE.search(str(k)):
                     report['outliers'].pop(k, None)
         except Exception:
             # non-fatal if regex or keys operation fails
@@ -286,4 +737,116 @@ def clean_dataframe(df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[pd.DataFr
     return df, report
 
 
-__all__ = ['clean_dataframe']
+def _clean_partition(part: pd.DataFrame, step_config: Dict[str, Any]) -> pd.DataFrame:
+    return _clean_pandas(part, step_config, {})
+
+
+def _fill_partition(part: pd.DataFrame, fill_map: Dict[str, Any]) -> pd.DataFrame:
+    return part.fillna(fill_map)
+
+
+def _dask_fill_values(ddf, config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Computes the frame-wide fill value for every column with nulls, as
+    _fill_nulls_step does for a pandas frame, plus the per-column null counts.
+
+    Median uses Dask's approximate quantiles, so it can differ slightly from
+    the exact pandas median on large inputs.
+    """
+    import dask
+
+    na_counts = ddf.isna().sum().compute()
+    null_cols = list(na_counts.index[na_counts > 0])
+    dtypes = ddf.dtypes[null_cols]
+    plan = _fill_plan(dtypes, config)
+
+    lazy = {}
+    for c, (stat, _) in plan.items():
+        if stat == 'mean':
+            lazy[c] = ddf[c].mean()
+        elif stat == 'median':
+            lazy[c] = ddf[c].median_approximate()
+        elif stat == 'mode':
+            lazy[c] = ddf[c].mode(dropna=True)
+    stats = {}
+    for c, val in zip(lazy, dask.compute(*lazy.values())):
+        if plan[c][0] == 'mode':
+            # pandas returns modes sorted, so take the smallest on ties
+            val = val.sort_values().iloc[0] if len(val) else None
+        if val is not None and not pd.isna(val):
+            stats[c] = val
+
+    fill_map = {}
+    for c, (stat, literal) in plan.items():
+        val = _decimal_stat(dtypes[c], stats.get(c, literal))
+        if val is not None and (stat not in ('mean', 'median') or _fill_fits(dtypes[c], val)):
+            fill_map[c] = val
+    return fill_map, {c: int(na_counts[c]) for c in fill_map}
+
+
+def clean_dataframe_dask(ddf, config: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Cleans a Dask DataFrame (e.g. a CSV too large to load at once) and returns
+    (cleaned_df, report) like clean_dataframe.
+
+    Trimming, null handling and blank-row removal run per partition and
+    duplicates are removed with Dask's drop_duplicates, so the raw input is
+    never held in memory as a whole; null filling takes one extra pass to
+    compute frame-wide fill values. The reduced frame is computed once, in
+    input row order, and the remaining steps run through clean_dataframe.
+    """
+    import dask
+
+    ncols = len(ddf.columns)
+    sizes = {'rows_in': ddf.shape[0]}
+    nulls_filled = None
+    col_renames = {}
+    if config.get('normalize_columns'):
+        # renamed up front so the report keys match the pandas path
+        new_cols = _normalize_column_names(ddf.columns)
+        col_renames = {old: new for old, new in zip(ddf.columns, new_cols) if old != new}
+        ddf = ddf.rename(columns=col_renames)
+    if config.get('trim_whitespace'):
+        ddf = ddf.map_partitions(_clean_partition, {'trim_whitespace': True})
+    if config.get('null_handling') == 'drop_rows':
+        ddf = ddf.map_partitions(_clean_partition, {'null_handling': 'drop_rows'})
+        sizes['after_nulls'] = ddf.shape[0]
+    elif config.get('null_handling') == 'fill':
+        fill_map, nulls_filled = _dask_fill_values(ddf, config)
+        ddf = ddf.map_partitions(_fill_partition, fill_map)
+    if config.get('drop_blank_rows'):
+        ddf = ddf.map_partitions(_clean_partition, {'drop_blank_rows': True})
+        sizes['after_blank'] = ddf.shape[0]
+    if config.get('drop_duplicates'):
+        sizes['before_dupes'] = ddf.shape[0]
+        # a single output partition keeps the first occurrences in input order
+        ddf = ddf.drop_duplicates(split_out=1)
+
+    # one compute for the reduced frame and every counter, sharing the graph
+    names = list(sizes)
+    result, *counts = dask.compute(ddf, *[sizes[n] for n in names])
+    sizes = dict(zip(names, counts))
+    result = result.reset_index(drop=True)
+
+    rest = {**config, 'normalize_columns': False, 'trim_whitespace': False,
+            'drop_blank_rows': False, 'drop_duplicates': False}
+    if config.get('null_handling') in ('drop_rows', 'fill'):
+        rest['null_handling'] = None
+    df, report = clean_dataframe(result, rest)
+
+    rows_in = sizes['rows_in']
+    rows = sizes.get('after_nulls', rows_in)
+    report['original_shape'] = (rows_in, ncols)
+    report['col_renames'] = col_renames
+    if 'after_nulls' in sizes:
+        report['nulls_dropped'] = rows_in - rows
+    if nulls_filled is not None:
+        report['nulls_filled'] = nulls_filled
+    if 'after_blank' in sizes:
+        report['blank_rows_dropped'] = rows - sizes['after_blank']
+    if 'before_dupes' in sizes:
+        report['duplicates_dropped'] = sizes['before_dupes'] - len(result)
+    report['rows_removed'] = rows_in - df.shape[0]
+    report['cols_removed'] = ncols - df.shape[1]
+    return df, report
+
+
+__all__ = ['clean_dataframe', 'clean_dataframe_dask']
@@ -0,0 +1,54 @@
+import io
+
+import pandas as pd
+
+
+def read_table(file_bytes: bytes, filename: str) -> pd.DataFrame:
+    """Parses an uploaded CSV/Excel file into a DataFrame.
+
+    Arrow-backed dtypes are preferred. The Arrow readers reject some inputs
+    (e.g. an Excel column mixing numbers and text), so each branch retries
+    with the default NumPy-backed parse.
+    """
+    if filename.lower().endswith(('.xls', '.xlsx')):
+        try:
+            return pd.read_excel(io.BytesIO(file_bytes), engine="calamine", dtype_backend="pyarrow")
+        except Exception:
+            # mixed-type columns cannot be held by one Arrow type; load them as object
+            return pd.read_excel(io.BytesIO(file_bytes), engine="calamine")
+    # multithreaded Arrow parser; columns land as Arrow-backed dtypes
+    try:
+        return pd.read_csv(io.BytesIO(file_bytes), engine="pyarrow", dtype_backend="pyarrow")
+    except Exception:
+        # the pyarrow parser is stricter; retry with the default one
+        return pd.read_csv(io.BytesIO(file_bytes), dtype_backend="pyarrow")
+
+
+def write_xlsx(df: pd.DataFrame, sheet_name: str) -> io.BytesIO:
+    """Streams df into an in-memory XLSX file using xlsxwriter's constant_memory mode.
+
+    constant_memory flushes each row as soon as the next one starts, so rows are
+    written directly here: pandas' ExcelWriter emits cells column by column, which
+    would drop data in that mode. Infinite values are written as Excel error
+    cells, as xlsxwriter cannot store them as numbers.
+    """
+    import xlsxwriter
+
+    towrite = io.BytesIO()
+    workbook = xlsxwriter.Workbook(towrite, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True,
+        'nan_inf_to_errors': True,
+    })
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(c) for c in df.columns], workbook.add_format({'bold': True}))
+    for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        # missing values become empty cells, as with DataFrame.to_excel
+        worksheet.write_row(r, 0, [None if pd.isna(v) else v for v in row])
+    workbook.close()
+    towrite.seek(0)
+    return towrite
+
+
+__all__ = ['read_table', 'write_xlsx']